@@ -0,0 +1,52 @@
+# code.py — CircuitPython SH1106 128x64, 5x5 custom font (“Hello World” centered)
+import time
+import board
+import busio
+
+from sh1106 import SH1106
+
+# ── DISPLAY TUNABLES ─────────────────────────────────────────────────────
+I2C_SCL    = board.GP1
+I2C_SDA    = board.GP0
+I2C_FREQ   = 400_000          # SH1106 fast mode; drop to 100_000 if the bus is flaky
+OLED_ADDR  = 0x3C             # often 0x3C (sometimes 0x3D)
+COL_OFFSET = 2                # try 2, then 0, then 4 if horizontally shifted
+MIRROR_H   = True             # A1 vs A0
+MIRROR_V   = True             # C8 vs C0
+RESET_PIN  = None             # e.g., board.GP2 if your module exposes RST
+# ─────────────────────────────────────────────────────────────────────────
+
+# set up I2C
+i2c = busio.I2C(I2C_SCL, I2C_SDA, frequency=I2C_FREQ)
+
+disp = SH1106(
+    i2c,
+    width=128,
+    height=64,
+    addr=OLED_ADDR,
+    col_offset=COL_OFFSET,
+    mirror_h=MIRROR_H,
+    mirror_v=MIRROR_V,
+    reset_pin=RESET_PIN
+)
+
+# "HELLO" in the 5x5 font, centered with 1px spacing (x=49, y=29), as a
+# ready-made 128x64 frame. Only pages 3 and 4 hold pixels. Produced by
+# running disp.fill(0); disp.text5("HELLO", 49, 29) once and dumping
+# bytes(disp.buffer); regenerate the same way if the text changes.
+_SPLASH = (
+    bytes(3 * 128 + 49)
+    + b"\xe0\x80\x80\x80\xe0\x00\xe0\xa0\xa0\xa0\xa0\x00\xe0\x00\x00"
+      b"\x00\x00\x00\xe0\x00\x00\x00\x00\x00\xe0\x20\x20\x20\xe0"
+    + bytes(128 - 29)
+    + b"\x03\x00\x00\x00\x03\x00\x03\x02\x02\x02\x02\x00\x03\x02\x02"
+      b"\x02\x02\x00\x03\x02\x02\x02\x02\x00\x03\x02\x02\x02\x03"
+    + bytes(128 - 49 - 29 + 3 * 128)
+)
+
+disp.buffer[:] = _SPLASH
+disp.show()
+
+while True:
+    time.sleep(1)
+
@@ -0,0 +1,329 @@
+# sh1106.py — CircuitPython SH1106 I2C OLED driver with a 5x5 custom font
+import time
+import struct
+import digitalio
+
+try:
+    import framebuf           # native MONO_VLSB drawing, if the build has it
+except ImportError:
+    framebuf = None
+
+# Your exact 5x5 font as one small flat bytes constant (40 bytes) instead
+# of per-glyph dicts/lists: 5 column bytes per glyph, LSB = top row,
+# matching the controller's vertical page layout so text5 can OR whole
+# columns in. Glyph N is the Nth character of _FONT5_CHARS, found with
+# str.find; an ord()-indexed table would be faster but costs ~1.3 KB of
+# RAM. Anything not listed draws as a space.
+_FONT5_CHARS = " HELOWRD"
+_FONT5_FLAT = (
+    b"\x00\x00\x00\x00\x00"  # " "
+    b"\x1f\x04\x04\x04\x1f"  # H
+    b"\x1f\x15\x15\x15\x15"  # E
+    b"\x1f\x10\x10\x10\x10"  # L
+    b"\x1f\x11\x11\x11\x1f"  # O
+    b"\x1f\x10\x1e\x10\x1f"  # W
+    b"\x1f\x0d\x15\x05\x07"  # R
+    b"\x1f\x11\x11\x0a\x04"  # D
+)
+
+class SH1106:
+    def __init__(self, i2c, width=128, height=64, addr=0x3C, col_offset=2,
+                 mirror_h=True, mirror_v=True, reset_pin=None):
+        self.i2c = i2c
+        self.addr = addr
+        self.width = width
+        self.height = height
+        self.pages = height // 8
+        self.col_offset = col_offset
+        self.buffer = bytearray(self.width * self.pages)
+        # MONO_VLSB is this controller's page layout, so framebuf can draw
+        # straight into self.buffer
+        self.fb = None
+        if framebuf is not None:
+            self.fb = framebuf.FrameBuffer(self.buffer, width, height,
+                                           framebuf.MONO_VLSB)
+        # preallocated I2C framing buffer so page writes don't allocate on
+        # the heap: a 7-byte page header (see _page_hdrs) followed by one
+        # page of pixel data, sent as a single transaction
+        self._page_buf = bytearray(7 + self.width)
+        self._back = None             # show_async() snapshot, made on first use
+        self._sending = False         # a show_async() transfer is in flight
+        # bit N set = page N changed since the last show(); start all dirty
+        self._all_pages = (1 << self.pages) - 1
+        self._dirty = self._all_pages
+        # prebuilt frames for fill() without framebuf: one native slice
+        # copy instead of a loop
+        if self.fb is None:
+            self._fill_on = b"\xff" * len(self.buffer)
+            self._fill_off = bytes(len(self.buffer))
+        # per-page header: page, col low, col high as single commands
+        # (control byte 0x80 = Co set, one command byte follows), then the
+        # 0x40 control byte that switches the rest of the write to data
+        self._page_hdrs = [
+            bytes((0x80, 0xB0 + p,
+                   0x80, 0x00 | (col_offset & 0x0F),
+                   0x80, 0x10 | ((col_offset >> 4) & 0x0F),
+                   0x40))
+            for p in range(self.pages)
+        ]
+
+        if reset_pin is not None:
+            rst = digitalio.DigitalInOut(reset_pin)
+            rst.direction = digitalio.Direction.OUTPUT
+            rst.value = True;  time.sleep(0.01)
+            rst.value = False; time.sleep(0.01)
+            rst.value = True;  time.sleep(0.05)
+
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self._init_display(mirror_h, mirror_v)
+        finally:
+            self.i2c.unlock()
+
+        self.fill(0)
+        self.show()
+
+    def _init_display(self, mirror_h, mirror_v):
+        # whole sequence in one transaction (~24 bytes, under the 32-byte
+        # SMBus block limit some I2C stacks enforce)
+        init_cmds = bytes((
+            0x00,                          # control byte: commands follow
+            0xAE,                          # display OFF
+            0xD5, 0x80,                    # clock
+            0xA8, self.height - 1,         # multiplex
+            0xD3, 0x00,                    # display offset
+            0x40,                          # start line 0
+            0xAD, 0x8B,                    # DC-DC on
+            0xA1 if mirror_h else 0xA0,    # seg remap
+            0xC8 if mirror_v else 0xC0,    # COM dir
+            0xDA, 0x12,                    # COM pins
+            0x81, 0x7F,                    # contrast
+            0xD9, 0xF1,                    # pre-charge
+            0xDB, 0x40,                    # VCOMH
+            0xA4,                          # resume from RAM
+            0xA6,                          # normal
+            0xAF,                          # display ON
+        ))
+        self.i2c.writeto(self.addr, init_cmds)
+        time.sleep(0.02)
+
+    # 1bpp framebuffer helpers
+    def invalidate(self):
+        """Mark every page for resending, e.g. after writing self.buffer directly."""
+        self._dirty = self._all_pages
+
+    def fill(self, color):
+        self._dirty = self._all_pages
+        if self.fb is not None:
+            self.fb.fill(1 if color else 0)
+            return
+        self.buffer[:] = self._fill_on if color else self._fill_off
+
+    def fill_page(self, page, value):
+        """Set every byte of one 8-pixel-tall page to value."""
+        if not (0 <= page < self.pages):
+            return
+        start = page * self.width
+        self.buffer[start:start + self.width] = bytes((value,)) * self.width
+        self._dirty |= 1 << page
+
+    def invert_buffer(self):
+        """Invert every pixel in the framebuffer."""
+        # CircuitPython has no bytes.translate, so XOR 32-bit words in
+        # place (a quarter of the iterations of a per-byte loop)
+        buf = self.buffer
+        unpack_from = struct.unpack_from
+        pack_into = struct.pack_into
+        end = len(buf) & ~3
+        for i in range(0, end, 4):
+            pack_into("<I", buf, i, unpack_from("<I", buf, i)[0] ^ 0xFFFFFFFF)
+        for i in range(end, len(buf)):
+            buf[i] ^= 0xFF
+        self._dirty = self._all_pages
+
+    def pixel(self, x, y, color=1):
+        if self.fb is not None:
+            # framebuf clips on its own
+            self.fb.pixel(x, y, 1 if color else 0)
+            if 0 <= y < self.height:
+                self._dirty |= 1 << (y >> 3)
+            return
+        w = self.width
+        if not (0 <= x < w and 0 <= y < self.height):
+            return
+        page = y >> 3
+        self._dirty |= 1 << page
+        buf  = self.buffer
+        bit  = y & 7
+        idx  = page * w + x
+        if color:
+            buf[idx] |= (1 << bit)
+        else:
+            buf[idx] &= ~(1 << bit)
+
+    def text5(self, s, x, y, color=1, spacing=1):
+        """Draw text using the 5x5 font at (x,y)."""
+        # writes go straight into self.buffer; pixel() is for callers
+        buf = self.buffer
+        w = self.width
+        pages = self.pages
+        table = _FONT5_FLAT
+        chars = _FONT5_CHARS
+        unpack_from = struct.unpack_from
+        pack_into = struct.pack_into
+        page, shift = divmod(y, 8)
+        lo_ok = 0 <= page < pages                 # page holding the top rows
+        hi_ok = shift and 0 <= page + 1 < pages   # spillover page below
+        if not (lo_ok or hi_ok):
+            return
+        if lo_ok:
+            self._dirty |= 1 << page
+        if hi_ok:
+            self._dirty |= 1 << (page + 1)
+        # per-byte masks for the packed words: after "<< shift" each byte
+        # keeps its own bits, after ">> (8 - shift)" only the carry bits
+        lo_mask = 0x01010101 * ((0xFF << shift) & 0xFF)
+        hi_mask = 0x01010101 * ((1 << shift) - 1)
+        row = page * w                            # buffer offset of page
+        cx = x
+        for ch in s:
+            if cx >= w:
+                break
+            o = chars.find(ch) * 5
+            if o < 0:
+                o = 0                              # not in the font: blank
+            if 0 <= cx <= w - 5:
+                # whole glyph on screen: columns 0-3 as one 32-bit word
+                g = unpack_from("<I", table, o)[0]
+                lo = (g << shift) & lo_mask
+                hi = (g >> (8 - shift)) & hi_mask
+                b4 = table[o + 4] << shift
+                idx = row + cx
+                # set/clear 4 packed column bytes at idx plus the 5th at idx+4
+                if lo_ok:
+                    cur = unpack_from("<I", buf, idx)[0]
+                    if color:
+                        pack_into("<I", buf, idx, cur | lo)
+                        buf[idx + 4] |= b4 & 0xFF
+                    else:
+                        pack_into("<I", buf, idx, cur & ~lo & 0xFFFFFFFF)
+                        buf[idx + 4] &= ~b4 & 0xFF
+                if hi_ok:
+                    idx += w
+                    cur = unpack_from("<I", buf, idx)[0]
+                    if color:
+                        pack_into("<I", buf, idx, cur | hi)
+                        buf[idx + 4] |= b4 >> 8
+                    else:
+                        pack_into("<I", buf, idx, cur & ~hi & 0xFFFFFFFF)
+                        buf[idx + 4] &= ~(b4 >> 8) & 0xFF
+            elif cx > -5:
+                # clipped at an edge: column by column
+                base = row + cx
+                for c in range(max(0, -cx), min(5, w - cx)):
+                    b = table[o + c] << shift
+                    idx = base + c
+                    if color:
+                        if lo_ok:
+                            buf[idx] |= b & 0xFF
+                        if hi_ok:
+                            buf[idx + w] |= b >> 8
+                    else:
+                        if lo_ok:
+                            buf[idx] &= ~b & 0xFF
+                        if hi_ok:
+                            buf[idx + w] &= ~(b >> 8) & 0xFF
+            cx += 5 + spacing  # advance with spacing
+
+    def text(self, s, x, y, color=1):
+        """Draw text with framebuf's built-in 8x8 font at (x,y)."""
+        if self.fb is None:
+            raise RuntimeError("text() needs the framebuf module; use text5()")
+        self.fb.text(s, x, y, 1 if color else 0)
+        # 8px tall glyphs touch at most two pages
+        for page in (y >> 3, (y + 7) >> 3):
+            if 0 <= page < self.pages:
+                self._dirty |= 1 << page
+
+    def _send_pages(self, src, pages):
+        # each page whose bit is set in pages: header + page data from src
+        # in a single transaction (caller holds the I2C lock)
+        buf = memoryview(src)
+        w = self.width
+        i2c = self.i2c
+        addr = self.addr
+        tx = self._page_buf
+        hdrs = self._page_hdrs
+        for page in range(self.pages):
+            if not pages & (1 << page):
+                continue
+            start = page * w
+            tx[:7] = hdrs[page]
+            tx[7:] = buf[start:start + w]
+            i2c.writeto(addr, tx)
+
+    def show(self, partial=False):
+        """Send the framebuffer to the display.
+
+        With partial=True only pages changed since the last show() are
+        sent. Changes are tracked by pixel, text5, text, fill, fill_page
+        and invert_buffer; after drawing any other way (through self.fb or
+        by writing self.buffer directly) call invalidate() first.
+        Raises RuntimeError while a show_async() transfer is in flight.
+        """
+        if self._sending:
+            raise RuntimeError("show() called during a show_async() transfer")
+        dirty = self._dirty if partial else self._all_pages
+        if not dirty:
+            return
+        while not self.i2c.try_lock():
+            pass
+        try:
+            self._send_pages(self.buffer, dirty)
+            self._dirty = 0
+        finally:
+            self.i2c.unlock()
+
+    async def show_async(self, partial=False):
+        """Send a snapshot of the frame, yielding to other tasks per page.
+
+        The frame is copied to a back buffer first, so the caller may start
+        drawing the next frame into self.buffer while this task runs, e.g.
+        via asyncio.create_task(disp.show_async()). A call made while another
+        transfer is in flight waits for it to finish before taking its own
+        snapshot. If the task is cancelled, pages it did not send stay dirty.
+        show() must not be called until the transfer has finished (it raises
+        RuntimeError), since the remaining pages of this older snapshot
+        would overwrite the newer frame. partial works as for show().
+        """
+        # imported here so programs that never call this don't pay for
+        # the asyncio library's heap
+        try:
+            import asyncio
+        except ImportError:
+            raise RuntimeError("show_async() needs the asyncio module")
+        while self._sending:
+            await asyncio.sleep(0)
+        self._sending = True
+        pending = 0
+        try:
+            if self._back is None:
+                self._back = bytearray(len(self.buffer))
+            self._back[:] = self.buffer
+            pending = self._dirty if partial else self._all_pages
+            self._dirty = 0
+            for page in range(self.pages):
+                if not pending & (1 << page):
+                    continue
+                while not self.i2c.try_lock():
+                    await asyncio.sleep(0)
+                try:
+                    self._send_pages(self._back, 1 << page)
+                finally:
+                    self.i2c.unlock()
+                pending &= ~(1 << page)
+                await asyncio.sleep(0)
+        finally:
+            self._dirty |= pending
+            self._sending = False